@@ -4,7 +4,7 @@ Pandas connector class to handle csv, parquet, xlsx files and pandas dataframes.
 
 import hashlib
 from functools import cache, cached_property
-from typing import Union
+from typing import Optional, Union
 
 import duckdb
 from pydantic import BaseModel
@@ -37,6 +37,7 @@ class PandasConnector(BaseConnector):
     pandas_df = pd.DataFrame
     _logger: Logger = None
     _additional_filters: list[list[str]] = None
+    _duckdb_connection: duckdb.DuckDBPyConnection = None
 
     def __init__(
         self,
@@ -160,13 +161,30 @@ class PandasConnector(BaseConnector):
         """
         return self._original_df.equals(other._original_df)
 
-    def enable_sql_query(self, table_name=None):
+    def enable_sql_query(
+        self,
+        table_name=None,
+        connection: Optional[duckdb.DuckDBPyConnection] = None,
+    ):
+        """
+        Register the dataframe as a table in duckdb.
+
+        Args:
+            table_name (str, optional): Name of the table, defaults to the
+                connector name.
+            connection (duckdb.DuckDBPyConnection, optional): Connection to
+                register the table in, defaults to duckdb's default connection.
+        """
         if not table_name and not self.name:
             raise PandasConnectorTableNotFound("Table name not found!")
 
+        if connection is None:
+            connection = duckdb.default_connection
+
         table = table_name or self.name
-        duckdb_relation = duckdb.from_df(self.pandas_df)
+        duckdb_relation = connection.from_df(self.pandas_df)
         duckdb_relation.create(table)
+        self._duckdb_connection = connection
         self.sql_enabled = True
         self.name = table
 
@@ -174,7 +192,7 @@ class PandasConnector(BaseConnector):
         if not self.sql_enabled:
             self.enable_sql_query()
         sql_query = sql_query.replace("`", '"')
-        return duckdb.query(sql_query).df()
+        return self._duckdb_connection.query(sql_query).df()
 
     @property
     def cs_table_name(self):
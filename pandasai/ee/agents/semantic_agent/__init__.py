@@ -1,6 +1,7 @@
 import json
 from typing import List, Optional, Type, Union
 
+import duckdb
 import pandas as pd
 
 from pandasai.agent.base import BaseAgent
@@ -25,6 +26,16 @@ from pandasai.schemas.df_config import Config
 from pandasai.vectorstores.vectorstore import VectorStore
 
 
+def _parse_schema(raw_schema: str) -> List[dict]:
+    """
+    Parse a raw schema string into a list of table schemas
+    """
+    schema_data = json.loads(raw_schema.replace("# SAMPLE SCHEMA", ""))
+    if isinstance(schema_data, dict):
+        schema_data = [schema_data]
+    return schema_data
+
+
 class SemanticAgent(BaseAgent):
     """
     Answer Semantic queries
@@ -41,9 +52,12 @@ class SemanticAgent(BaseAgent):
         pipeline: Optional[Type[GenerateChatPipeline]] = None,
         vectorstore: Optional[VectorStore] = None,
         description: str = None,
+        duckdb_connection: Optional[duckdb.DuckDBPyConnection] = None,
     ):
         super().__init__(dfs, config, memory_size, vectorstore, description)
 
+        self._duckdb_connection = duckdb_connection
+
         self._validate_config()
 
         self._schema_cache = Cache("schema")
@@ -122,10 +136,23 @@ class SemanticAgent(BaseAgent):
 
         self.execute_code(code)
 
-    def init_duckdb_instance(self):
+    def init_duckdb_instance(
+        self, connection: Optional[duckdb.DuckDBPyConnection] = None
+    ):
+        """
+        Register the pandas dataframes as duckdb tables named after the schema
+
+        Args:
+            connection (duckdb.DuckDBPyConnection, optional): connection to
+                register the tables in, defaults to the connection the agent
+                was built with, or duckdb's default connection
+        """
+        if connection is None:
+            connection = self._duckdb_connection
+
         for index, tables in enumerate(self._schema):
             if isinstance(self.dfs[index], PandasConnector):
-                self.dfs[index].enable_sql_query(tables["table"])
+                self.dfs[index].enable_sql_query(tables["table"], connection)
 
     def _create_schema(self):
         """
@@ -139,7 +166,7 @@ class SemanticAgent(BaseAgent):
         if self.config.enable_cache:
             value = self._schema_cache.get(key)
             if value is not None:
-                self._schema = json.loads(value)
+                self._schema = _parse_schema(value)
                 self.logger.log(f"using schema: {self._schema}")
                 return
 
@@ -150,12 +177,7 @@ class SemanticAgent(BaseAgent):
             f"""Initializing Schema:  {result}
             """
         )
-        self._schema = result.replace("# SAMPLE SCHEMA", "")
-        schema_data = json.loads(result.replace("# SAMPLE SCHEMA", ""))
-        if isinstance(schema_data, dict):
-            schema_data = [schema_data]
-
-        self._schema = schema_data
+        self._schema = _parse_schema(result)
         # save schema in the cache
         if self.config.enable_cache:
             self._schema_cache.set(key, json.dumps(self._schema))
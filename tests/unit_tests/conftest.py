@@ -1,5 +1,6 @@
 from unittest.mock import MagicMock, patch
 
+import duckdb
 import pytest
 
 
@@ -9,3 +10,26 @@ def mock_json_load():
 
     with patch("json.load", mock):
         yield mock
+
+
+@pytest.fixture(scope="session")
+def duckdb_session_conn():
+    connection = duckdb.connect()
+    yield connection
+    connection.close()
+
+
+@pytest.fixture
+def duckdb_conn(duckdb_session_conn):
+    """
+    Shared in-memory duckdb connection, dropping the tables a test created
+    once it is done with it.
+    """
+    yield duckdb_session_conn
+
+    tables = duckdb_session_conn.execute(
+        "SELECT table_name FROM information_schema.tables "
+        "WHERE table_type = 'BASE TABLE'"
+    ).fetchall()
+    for (table,) in tables:
+        duckdb_session_conn.execute(f'DROP TABLE "{table}"')
@@ -73,3 +73,14 @@ class TestPandasConnector:
         connector = PandasConnector({"original_df": input_data})
         with pytest.raises(Exception):
             connector.enable_sql_query()
+
+    def test_enable_sql_query_with_connection(self, duckdb_conn):
+        input_data = {"column1": [1, 2, 3], "column2": [4, 5, 6]}
+        connector = PandasConnector({"original_df": input_data})
+        connector.enable_sql_query("test_table", duckdb_conn)
+
+        result = connector.execute_direct_sql_query(
+            "SELECT SUM(column2) AS total FROM `test_table`"
+        )
+        assert result["total"][0] == 15
+        assert duckdb_conn.table("test_table").shape == (3, 2)
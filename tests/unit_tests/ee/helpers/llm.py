@@ -0,0 +1,12 @@
+from pandasai.llm.bamboo_llm import BambooLLM
+from tests.unit_tests.ee.helpers.schema import VIZ_QUERY_SCHEMA_STR
+
+
+class MockBambooLLM(BambooLLM):
+    def __init__(self, output: str = VIZ_QUERY_SCHEMA_STR):
+        # Skip BambooLLM.__init__, which sets up an API session that the
+        # mocked call never uses
+        self._output = output
+
+    def call(self, instruction=None, _context=None) -> str:
+        return self._output
@@ -0,0 +1,39 @@
+from typing import Optional
+from unittest.mock import MagicMock
+
+import pandas as pd
+import pytest
+
+from pandasai.agent import Agent
+from pandasai.ee.agents.semantic_agent import SemanticAgent
+from pandasai.llm.fake import FakeLLM
+from tests.unit_tests.ee.helpers.llm import MockBambooLLM
+
+
+@pytest.fixture(autouse=True)
+def forbid_mocker(request):
+    """
+    Fail tests in this directory that request pytest-mock's `mocker` fixture,
+    whose patch helpers inspect the caller's stack on every call. Use
+    `monkeypatch` or `unittest.mock` instead.
+    """
+    if "mocker" in request.fixturenames:
+        pytest.fail(
+            f"{request.node.nodeid} uses the `mocker` fixture, "
+            "use `monkeypatch` or `unittest.mock` instead"
+        )
+
+
+@pytest.fixture
+def mock_bamboo_llm() -> MockBambooLLM:
+    return MockBambooLLM()
+
+
+@pytest.fixture
+def llm(output: Optional[str] = None) -> FakeLLM:
+    return FakeLLM(output=output)
+
+
+@pytest.fixture(scope="module")
+def agent(sample_df: pd.DataFrame) -> Agent:
+    return SemanticAgent(sample_df, {"llm": MockBambooLLM()}, vectorstore=MagicMock())